@@ -1,5 +1,4 @@
-from .api import get_path, get_url, fetch  # noqa
-from .data import data  # noqa
+from .api import get_path, get_url, fetch, fetch_async, clear_path_cache  # noqa
 from .lib import Bunch, Dataset  # noqa
 
 from importlib.metadata import PackageNotFoundError, version
@@ -9,3 +8,13 @@ try:
 except PackageNotFoundError:  # noqa
     # package is not installed
     pass
+
+
+def __getattr__(name):
+    # defer loading the database until ``data`` is actually used
+    if name == "data":
+        from .data import data
+
+        globals()["data"] = data
+        return data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,50 @@
-import pooch
-
-from .data import data
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-flat = data.flatten()
+import pooch
 
-registry = {value["filename"]: value["hash"] for value in flat.values()}
-urls = {value["filename"]: value["url"] for value in flat.values()}
+from .lib import _normalize
 
 CACHE = pooch.create(
-    path=pooch.os_cache("geodatasets"), base_url="", registry=registry, urls=urls
+    path=pooch.os_cache("geodatasets"), base_url="", registry={}, urls={}
 )
 
+_NAME_INDEX = None
+_NAME_INDEX_SOURCE = None
+
+
+def _ensure_registered(dataset):
+    """Register ``dataset`` with the pooch cache on first use."""
+    if dataset.filename not in CACHE.registry:
+        CACHE.registry[dataset.filename] = dataset.hash
+        CACHE.urls[dataset.filename] = dataset.url
+
+
+def _resolve(name):
+    """Return the :class:`~geodatasets.Dataset` matching ``name``.
+
+    The normalized index is built from the database on first use, so
+    importing the package does not pay for the full registry. Canonical
+    names hit the flat dict directly without normalization. The flat view
+    is a fresh object whenever the registry was mutated, so the index is
+    rebuilt alongside it.
+    """
+    from .data import data
+
+    flat = data.flatten()
+    if name in flat:
+        return flat[name]
+
+    global _NAME_INDEX, _NAME_INDEX_SOURCE
+    if _NAME_INDEX_SOURCE is not flat:
+        _NAME_INDEX = {_normalize(k): v for k, v in flat.items()}
+        _NAME_INDEX_SOURCE = flat
+    try:
+        return _NAME_INDEX[_normalize(name)]
+    except KeyError:
+        raise ValueError(f"No matching item found for the query '{name}'.") from None
+
 
 def get_url(name):
     """Get the URL from which the dataset can be fetched.
@@ -43,7 +77,7 @@ def get_url(name):
     >>> geodatasets.get_url('geoda_airbnb')
     'https://geodacenter.github.io/data-and-lab//data/airbnb.zip'
     """
-    return data.query_name(name).url
+    return _resolve(name).url
 
 
 def get_path(name):
@@ -83,11 +117,73 @@ def get_path(name):
     >>> path2
     '/Users/martin/Library/Caches/geodatasets/airbnb.zip'
     """
-    dataset = data.query_name(name)
+    dataset = _resolve(name)
     return dataset.path
 
 
-def fetch(name):
+_PATH_CACHE = {}
+
+
+def _fetch_path(dataset):
+    """Resolve the local path of ``dataset``, downloading it if needed.
+
+    The resolved path is memoized per process, so repeat calls skip pooch's
+    hash verification and archive enumeration; the first call still runs
+    them as usual. A cached path is only served while both it and the source
+    file in the pooch cache still exist, so removing either from the local
+    storage triggers a fresh download.
+    """
+    key = (dataset.filename, tuple(dataset.get("members", ())))
+    cached = _PATH_CACHE.get(key)
+    if (
+        cached is not None
+        and os.path.exists(cached)
+        and os.path.exists(CACHE.abspath / dataset.filename)
+    ):
+        return cached
+
+    _ensure_registered(dataset)
+    members = dataset.get("members")
+    if members is not None:
+        unzipped_files = CACHE.fetch(
+            dataset.filename, processor=pooch.Unzip(members=members)
+        )
+        if len(unzipped_files) == 1:
+            path = unzipped_files[0]
+        elif len(unzipped_files) > 1:  # shapefile
+            path = [f for f in unzipped_files if f.endswith(".shp")][0]
+        else:
+            raise ValueError(f"No files extracted from {dataset.filename!r}.")
+    else:
+        path = CACHE.fetch(dataset.filename)
+
+    _PATH_CACHE[key] = path
+    return path
+
+
+def clear_path_cache():
+    """Clear the in-process cache of resolved dataset paths.
+
+    Call this after removing or replacing files in the pooch cache outside
+    of geodatasets, so the next :func:`get_path` re-checks the storage.
+    """
+    _PATH_CACHE.clear()
+
+
+def _fetch_one(dataset):
+    """Download a single :class:`~geodatasets.Dataset` into the cache."""
+    _ensure_registered(dataset)
+    members = dataset.get("members")
+    if members is not None:
+        _ = CACHE.fetch(
+            dataset.filename,
+            processor=pooch.Unzip(members=members),
+        )
+    else:
+        _ = CACHE.fetch(dataset.filename)
+
+
+def fetch(name, max_workers=8):
     """Download the data to the local storage.
 
     This is useful when it is expected that some data will be needed later but you
@@ -103,6 +199,9 @@ def fetch(name):
     ----------
     name : str, list
         Name of the data item(s). Formatting does not matter.
+    max_workers : int, default 8
+        Maximum number of threads used to download multiple datasets
+        concurrently.
 
     See also
     --------
@@ -140,12 +239,47 @@ y.zip' to '/Users/martin/Library/Caches/geodatasets/guerry.zip.unzip'
     if isinstance(name, str):
         name = [name]
 
-    for n in name:
-        dataset = data.query_name(n)
-        if "members" in dataset.keys():
-            _ = CACHE.fetch(
-                data.query_name(n).filename,
-                processor=pooch.Unzip(members=dataset.members),
-            )
-        else:
-            _ = CACHE.fetch(data.query_name(n).filename)
+    datasets = [_resolve(n) for n in name]
+
+    if len(datasets) <= 1:
+        for dataset in datasets:
+            _fetch_one(dataset)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(datasets))
+        ) as executor:
+            list(executor.map(_fetch_one, datasets))
+
+
+async def fetch_async(name, max_concurrency=16):
+    """Download the data to the local storage without blocking the event loop.
+
+    An asynchronous counterpart of :func:`fetch` for use inside ``asyncio``
+    applications. Downloads run on executor threads (the blocking network I/O
+    releases the GIL), with at most ``max_concurrency`` in flight at once.
+    Hash verification and archive extraction are handled by pooch exactly as
+    in :func:`fetch`.
+
+    Parameters
+    ----------
+    name : str, list
+        Name of the data item(s). Formatting does not matter.
+    max_concurrency : int, default 16
+        Maximum number of downloads in flight at once.
+
+    See also
+    --------
+    fetch
+    """
+    if isinstance(name, str):
+        name = [name]
+
+    datasets = [_resolve(n) for n in name]
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch_one_async(dataset):
+        async with semaphore:
+            await loop.run_in_executor(None, _fetch_one, dataset)
+
+    await asyncio.gather(*(_fetch_one_async(dataset) for dataset in datasets))
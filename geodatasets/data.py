@@ -1,8 +1,18 @@
 import pkgutil
 
-from . import json
 from .lib import _load_json
 
-json = pkgutil.get_data("geodatasets", "json/database.json")
 
-data = _load_json(json)
+def __getattr__(name):
+    """Load and parse the bundled database on first access to ``data``.
+
+    Keeps ``import geodatasets`` cheap for code that never touches the
+    registry, while ``data`` itself stays a real :class:`~geodatasets.Bunch`
+    with full dict semantics. The result is memoized as a module attribute,
+    so the parse happens once per process.
+    """
+    if name == "data":
+        global data
+        data = _load_json(pkgutil.get_data("geodatasets", "json/database.json"))
+        return data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,14 +6,47 @@ under BSD 3-clause
 """
 from __future__ import annotations
 
-import json
-import uuid
+import functools
+import itertools
+import sys
+import weakref
 from typing import Callable
 
-import pooch
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 GEOMETRY_TYPES = ["POINT", "LINESTRING", "POLYGON", "MIXED"]
 QUERY_NAME_TRANSLATION = str.maketrans({x: "" for x in "., -_/"})
+# drops spacing/punctuation and folds ASCII upper case in a single pass
+_NORMALIZE_TRANSLATION = {
+    **{ord(x): None for x in "., -_/"},
+    **{c: c + 32 for c in range(ord("A"), ord("Z") + 1)},
+}
+
+_UID_COUNTER = itertools.count()
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """Strip spacing and punctuation characters and lower-case ``name``.
+
+    Cached, so querying the same spelling repeatedly skips the translate
+    pass altogether.
+    """
+    return name.translate(_NORMALIZE_TRANSLATION)
+
+
+_CHILD_TEMPLATE = """
+            <li class="xyz-child">
+                <input type="checkbox" id="%s" class="xyz-checkbox"/>
+                <label for="%s">%s <span>%s</span></label>
+                <div class="xyz-inside">
+                    %s
+                </div>
+            </li>
+            """
 
 
 class Bunch(dict):
@@ -31,25 +64,77 @@ class Bunch(dict):
     def __dir__(self):
         return self.keys()
 
+    def _invalidate_cache(self):
+        """Drop cached derived structures after a mutation.
+
+        Walks the parent backrefs recorded by :meth:`flatten`, so mutating a
+        nested Bunch or Dataset also drops the cached views of every ancestor
+        that flattened it. Backrefs are weak; dead ones are pruned here.
+        """
+        stack = [self]
+        seen = set()
+        while stack:
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            item.__dict__.pop("_flat", None)
+            item.__dict__.pop("_name_index", None)
+            item.__dict__.pop("_search_blob", None)
+            parents = item.__dict__.get("_parents")
+            if parents:
+                alive = []
+                for ref in parents:
+                    parent = ref()
+                    if parent is not None:
+                        alive.append(ref)
+                        stack.append(parent)
+                parents[:] = alive
+
+    def __setitem__(self, key, value):
+        self._invalidate_cache()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_cache()
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self._invalidate_cache()
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self._invalidate_cache()
+        super().clear()
+
+    def pop(self, key, *args):
+        if key in self:
+            self._invalidate_cache()
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._invalidate_cache()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._invalidate_cache()
+        return super().setdefault(key, default)
+
     def _repr_html_(self, inside=False):
-        children = ""
-        for key in self.keys():
-            if isinstance(self[key], Dataset):
+        parts = []
+        for key, value in self.items():
+            if type(value) is Dataset:
                 obj = "geodatasets.Dataset"
             else:
                 obj = "geodatasets.Bunch"
-            uid = str(uuid.uuid4())
-            children += f"""
-            <li class="xyz-child">
-                <input type="checkbox" id="{uid}" class="xyz-checkbox"/>
-                <label for="{uid}">{key} <span>{obj}</span></label>
-                <div class="xyz-inside">
-                    {self[key]._repr_html_(inside=True)}
-                </div>
-            </li>
-            """
+            uid = f"xyz-{next(_UID_COUNTER)}"
+            parts.append(
+                _CHILD_TEMPLATE % (uid, uid, key, obj, value._repr_html_(inside=True))
+            )
+        children = "".join(parts)
 
-        style = "" if inside else f"<style>{CSS_STYLE}</style>"
+        style = "" if inside else _STYLE_BLOCK
         html = f"""
         <div>
         {style}
@@ -81,16 +166,35 @@ class Bunch(dict):
             dictionary of :class:`Dataset` objects
         """
 
-        flat = {}
+        flat = self.__dict__.get("_flat")
+        if flat is not None:
+            return flat
 
-        def _get_items(item):
+        flat = {}
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if item is not self:
+                # weak backref (pruned as it goes) so a mutation anywhere
+                # below invalidates this cache without pinning dead Bunches
+                parents = item.__dict__.setdefault("_parents", [])
+                alive = []
+                registered = False
+                for ref in parents:
+                    parent = ref()
+                    if parent is None:
+                        continue
+                    alive.append(ref)
+                    if parent is self:
+                        registered = True
+                if not registered:
+                    alive.append(weakref.ref(self))
+                parents[:] = alive
             if isinstance(item, Dataset):
                 flat[item.name] = item
             else:
-                for prov in item.values():
-                    _get_items(prov)
-
-        _get_items(self)
+                stack.extend(reversed(list(item.values())))
+        self.__dict__["_flat"] = flat
 
         return flat
 
@@ -111,13 +215,17 @@ class Bunch(dict):
         -------
         match: Dataset
         """
-        xyz_flat_lower = {
-            k.translate(QUERY_NAME_TRANSLATION).lower(): v
-            for k, v in self.flatten().items()
-        }
-        name_clean = name.translate(QUERY_NAME_TRANSLATION).lower()
-        if name_clean in xyz_flat_lower:
-            return xyz_flat_lower[name_clean]
+        flat = self.flatten()
+        if name in flat:
+            return flat[name]
+
+        name_index = self.__dict__.get("_name_index")
+        if name_index is None:
+            name_index = {_normalize(k): v for k, v in self.flatten().items()}
+            self.__dict__["_name_index"] = name_index
+        name_clean = _normalize(name)
+        if name_clean in name_index:
+            return name_index[name_clean]
 
         raise ValueError(f"No matching item found for the query '{name}'.")
 
@@ -189,70 +297,66 @@ class Bunch(dict):
         >>> small = data.filter(function=small_data)
         """
 
-        def _validate(dataset, keyword, name, geometry_type):
-            cond = []
-
-            if keyword is not None:
-                keyword_match = False
-                for v in dataset.values():
-                    if isinstance(v, str) and keyword.lower() in v.lower():
-                        keyword_match = True
-                        break
-                cond.append(keyword_match)
-
-            if name is not None:
-                name_match = False
-                if name.lower() in dataset.name.lower():
-                    name_match = True
-                cond.append(name_match)
-
-            if geometry_type is not None:
-                geom_type_match = False
-                if (
-                    dataset.geometry_type.upper()
-                    == geometry_type.translate(QUERY_NAME_TRANSLATION).upper()
-                ):
-                    geom_type_match = True
-                cond.append(geom_type_match)
-
-            return all(cond)
-
-        def _filter_bunch(bunch, keyword, name, geometry_type, function):
+        # normalize the conditions once; checks run cheapest-first and bail
+        # out on the first miss, so the keyword scan is skipped for datasets
+        # already eliminated by geometry_type or name
+        keyword_clean = keyword.lower() if keyword is not None else None
+        name_clean = name.lower() if name is not None else None
+        geometry_type_clean = (
+            _normalize(geometry_type) if geometry_type is not None else None
+        )
+
+        def _validate(dataset):
+            if (
+                geometry_type_clean is not None
+                and dataset.geometry_type.lower() != geometry_type_clean
+            ):
+                return False
+            if name_clean is not None and name_clean not in dataset.name.lower():
+                return False
+            if keyword_clean is not None and keyword_clean not in dataset._search_blob:
+                return False
+            return True
+
+        def _filter_bunch(bunch, function):
             new = Bunch()
             for key, value in bunch.items():
                 if isinstance(value, Dataset):
                     if function is None:
-                        if _validate(
-                            value,
-                            keyword=keyword,
-                            name=name,
-                            geometry_type=geometry_type,
-                        ):
+                        if _validate(value):
                             new[key] = value
                     else:
                         if function(value):
                             new[key] = value
 
                 else:
-                    filtered = _filter_bunch(
-                        value,
-                        keyword=keyword,
-                        name=name,
-                        geometry_type=geometry_type,
-                        function=function,
-                    )
+                    filtered = _filter_bunch(value, function=function)
                     if filtered:
                         new[key] = filtered
 
             return new
 
-        return _filter_bunch(
-            self,
-            keyword=keyword,
-            name=name,
-            geometry_type=geometry_type,
-            function=function,
-        )
+        return _filter_bunch(self, function=function)
+
+
+def _required_field(key):
+    """Create a property reading a required key directly from the dict.
+
+    Attribute access through a descriptor skips the ``__getattr__`` fallback,
+    which only fires after a failed regular lookup. A missing key still
+    surfaces as :class:`AttributeError`, matching the fallback's contract.
+    """
+
+    def _get(self):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def _set(self, value):
+        self[key] = value
+
+    return property(_get, _set)
 
 
 class Dataset(Bunch):
@@ -261,31 +365,62 @@ class Dataset(Bunch):
     can be called to update keys
     """
 
+    name = _required_field("name")
+    url = _required_field("url")
+    hash = _required_field("hash")
+    filename = _required_field("filename")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if "name" in self and "url" in self and "hash" in self and "filename" in self:
+            return
         required = ["name", "url", "hash", "filename"]
-        missing = []
-        for el in required:
-            if el not in self.keys():
-                missing.append(el)
-        if len(missing) > 0:
-            msg = (
-                f"The attributes {required} "
-                f"are required to initialise "
-                f"a `Dataset`. Please provide values for: "
-                f'`{"`, `".join(missing)}`'
-            )
-            raise AttributeError(msg)
+        missing = [el for el in required if el not in self]
+        msg = (
+            f"The attributes {required} "
+            f"are required to initialise "
+            f"a `Dataset`. Please provide values for: "
+            f'`{"`, `".join(missing)}`'
+        )
+        raise AttributeError(msg)
+
+    @classmethod
+    def _from_trusted(cls, data) -> Dataset:
+        """Construct a :class:`Dataset` from an already validated mapping.
+
+        Skips the required-keys check in ``__init__``; used when loading the
+        bundled database where every record is known to be complete.
+        """
+        new = cls.__new__(cls)
+        dict.__init__(new, data)
+        return new
 
     def __call__(self, **kwargs) -> Dataset:
-        new = Dataset(self)  # takes a copy preserving the class
+        # takes a copy preserving the class; self is already validated
+        new = Dataset._from_trusted(self)
         new.update(kwargs)
         return new
 
     def copy(self, **kwargs) -> Dataset:
-        new = Dataset(self)  # takes a copy preserving the class
+        # takes a copy preserving the class; self is already validated
+        new = Dataset._from_trusted(self)
+        if kwargs:
+            new.update(kwargs)
         return new
 
+    @property
+    def _search_blob(self) -> str:
+        """Lower-cased concatenation of all string values.
+
+        Cached on the instance (cleared on mutation) so repeated keyword
+        filters do not re-lowercase every value.
+        """
+        blob = self.__dict__.get("_search_blob")
+        if blob is None:
+            blob = "\n".join(v.lower() for v in self.values() if isinstance(v, str))
+            self.__dict__["_search_blob"] = blob
+        return blob
+
     @property
     def path(self) -> str:
         """Get the absolute path to a file in the local storage.
@@ -299,28 +434,19 @@ class Dataset(Bunch):
         str
             loacal path
         """
-        from .api import CACHE
+        from .api import _fetch_path
 
-        if "members" in self.keys():
-            unzipped_files = CACHE.fetch(
-                self.filename, processor=pooch.Unzip(members=self.members)
-            )
-            if len(unzipped_files) == 1:
-                return unzipped_files[0]
-            elif len(unzipped_files) > 1:  # shapefile
-                return [f for f in unzipped_files if f.endswith(".shp")][0]
-            else:
-                raise
-
-        return CACHE.fetch(self.filename)
+        return _fetch_path(self)
 
     def _repr_html_(self, inside=False):
-        item_info = ""
-        for key, val in self.items():
-            if key != "name":
-                item_info += f"<dt><span>{key}</span></dt><dd>{val}</dd>"
-
-        style = "" if inside else f"<style>{CSS_STYLE}</style>"
+        parts = [
+            f"<dt><span>{key}</span></dt><dd>{val}</dd>"
+            for key, val in self.items()
+            if key != "name"
+        ]
+        item_info = "".join(parts)
+
+        style = "" if inside else _STYLE_BLOCK
         html = f"""
         <div>
         {style}
@@ -341,18 +467,33 @@ class Dataset(Bunch):
         return html
 
 
+def _intern_strings(d):
+    """Intern short string values of a plain dict.
+
+    Values repeated across datasets (URL prefixes, geometry types, ...) then
+    share a single interned copy instead of one str per record.
+    """
+    for k, v in d.items():
+        if isinstance(v, str) and len(v) < 128:
+            d[k] = sys.intern(v)
+    return d
+
+
 def _load_json(f):
-    data = json.loads(f)
+    data = _json_loads(f)
 
     items = Bunch()
 
-    for item_name in data.keys():
-        item = data[item_name]
-
-        if "url" in item.keys():
-            items[item_name] = Dataset(item)
+    for item_name, item in data.items():
+        if "url" in item:
+            items[item_name] = Dataset._from_trusted(_intern_strings(item))
         else:
-            items[item_name] = Bunch({i: Dataset(item[i]) for i in item})
+            items[item_name] = Bunch(
+                {
+                    i: Dataset._from_trusted(_intern_strings(v))
+                    for i, v in item.items()
+                }
+            )
 
     return items
 
@@ -474,3 +615,5 @@ ul.xyz-collapsible {
     margin-bottom: 10px;
 }
 """
+
+_STYLE_BLOCK = f"<style>{CSS_STYLE}</style>"
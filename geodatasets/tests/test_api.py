@@ -1,3 +1,4 @@
+import asyncio
 import os
 from pathlib import Path
 
@@ -26,6 +27,17 @@ def test_get_path():
     os.remove(in_cache)
 
 
+def test_fetch_async(monkeypatch):
+    fetched = []
+
+    def fake_fetch(fname, processor=None):
+        fetched.append(fname)
+
+    monkeypatch.setattr(geodatasets.api.CACHE, "fetch", fake_fetch)
+    asyncio.run(geodatasets.fetch_async(["nybb", "geoda airbnb"]))
+    assert sorted(fetched) == ["airbnb.zip", "nybb_16a.zip"]
+
+
 @pytest.mark.request
 def test_fetch():
     # clear cache
@@ -101,6 +101,11 @@ def test_copy(data1):
     copied = data1.copy()
     assert isinstance(copied, Dataset)
 
+    overridden = data1.copy(hash="myhash")
+    assert overridden["hash"] == "myhash"
+    # check that original item dict is not modified
+    assert data1["hash"] == "qwertyuiopasdfghjklzxcvbnm1234567890"
+
 
 def test_callable():
     # only testing the callable functionality to override a keyword, as we
@@ -126,6 +131,20 @@ def test_flatten(data1, data2):
     assert len(nested_bunch.flatten()) == 4
 
 
+def test_cache_invalidation(data1, data2):
+    nested_bunch = Bunch(first_bunch=Bunch(first=data1))
+
+    assert len(nested_bunch.flatten()) == 1
+    nested_bunch.first_bunch["second"] = data2
+    assert len(nested_bunch.flatten()) == 2
+    assert nested_bunch.query_name("my_public_data2").name == "my_public_data2"
+
+    del nested_bunch.first_bunch["second"]
+    assert len(nested_bunch.flatten()) == 1
+    with pytest.raises(ValueError, match="No matching item found"):
+        nested_bunch.query_name("my_public_data2")
+
+
 def test_query_name():
     options = [
         "ny.bb",